@@ -1 +1,9 @@
-"""pydaikin module."""
+"""pydaikin module.
+
+Appliances created without a ClientSession share one http session per event
+loop. Call close_shared_session() on that loop once done with them.
+"""
+
+from .daikin_base import close_shared_session
+
+__all__ = ['close_shared_session']
@@ -1,14 +1,17 @@
 """Pydaikin base appliance, represent a Daikin device."""
 
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
 import logging
 import socket
+import threading
+import time
 from typing import Optional
 from urllib.parse import unquote
+from weakref import WeakKeyDictionary
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from aiohttp.web_exceptions import HTTPForbidden
 from retry import retry
 
@@ -19,9 +22,69 @@ from .values import ApplianceValues
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a name resolved by discover_ip is reused, like the connector's DNS cache
+DISCOVER_IP_TTL = 300
+_DISCOVERED_IPS = {}
+
+# Sessions shared by appliances created without their own session, one per event
+# loop: a session must only be used and closed from the loop it was created on
+_SHARED_SESSIONS: WeakKeyDictionary = WeakKeyDictionary()
+_SHARED_SESSIONS_LOCK = threading.Lock()
+
+
+async def _get_shared_session() -> ClientSession:
+    """Return the http session shared on the running loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    with _SHARED_SESSIONS_LOCK:
+        for other_loop, other_session in list(_SHARED_SESSIONS.items()):
+            if other_loop.is_closed():
+                del _SHARED_SESSIONS[other_loop]
+                if not other_session.closed:
+                    _LOGGER.warning(
+                        'Abandoned http session of a closed event loop, '
+                        'call close_shared_session() before the loop ends'
+                    )
+
+        session = _SHARED_SESSIONS.get(loop)
+        if session is None or session.closed:
+            session = ClientSession(
+                connector=TCPConnector(
+                    limit=64,
+                    limit_per_host=Appliance.MAX_CONCURRENT_REQUESTS,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=ClientTimeout(total=Appliance.REQUEST_TIMEOUT),
+            )
+            _SHARED_SESSIONS[loop] = session
+    return session
+
+
+async def close_shared_session():
+    """Close the http session shared on the running loop by appliances created
+    without a session."""
+    with _SHARED_SESSIONS_LOCK:
+        session = _SHARED_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
 
 class Appliance(DaikinPowerMixin):  # pylint: disable=too-many-public-methods
-    """Daikin main appliance class."""
+    """Daikin main appliance class.
+
+    Base attributes live in __slots__. Subclasses that do not declare their own
+    __slots__ still get a __dict__ for their extra attributes."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    __slots__ = (
+        'values',
+        'session',
+        '_energy_consumption_history',
+        'device_ip',
+        'base_url',
+        'request_semaphore',
+    )
 
     base_url: str
     session: Optional[ClientSession]
@@ -36,6 +99,18 @@ class Appliance(DaikinPowerMixin):  # pylint: disable=too-many-public-methods
 
     MAX_CONCURRENT_REQUESTS = 4
 
+    REQUEST_TIMEOUT = 10
+
+    _TRANSLATIONS_REV = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Build the reversed TRANSLATIONS lookup once per class."""
+        super().__init_subclass__(**kwargs)
+        cls._TRANSLATIONS_REV = {
+            dim: {v: k for k, v in item.items()}
+            for dim, item in cls.TRANSLATIONS.items()
+        }
+
     @classmethod
     def daikin_to_human(cls, dimension, value):
         """Return converted values from Daikin to Human."""
@@ -44,11 +119,7 @@ class Appliance(DaikinPowerMixin):  # pylint: disable=too-many-public-methods
     @classmethod
     def human_to_daikin(cls, dimension, value):
         """Return converted values from Human to Daikin."""
-        translations_rev = {
-            dim: {v: k for k, v in item.items()}
-            for dim, item in cls.TRANSLATIONS.items()
-        }
-        return translations_rev.get(dimension, {}).get(value, value)
+        return cls._TRANSLATIONS_REV.get(dimension, {}).get(value, value)
 
     @classmethod
     def daikin_values(cls, dimension):
@@ -71,28 +142,35 @@ class Appliance(DaikinPowerMixin):  # pylint: disable=too-many-public-methods
         """Return translated name to ip address."""
         try:
             socket.inet_aton(device_id)
-            device_ip = device_id  # id is an IP
+            return device_id  # id is an IP
         except socket.error:
-            device_ip = None
-
-        if device_ip is None:
-            # id is a common name, try discovery
-            device_name = get_name(device_id)
-            if device_name is None:
-                # try DNS
-                try:
-                    device_ip = socket.gethostbyname(device_id)
-                except socket.gaierror as exc:
-                    raise ValueError(f"no device found for {device_id}") from exc
-            else:
-                device_ip = device_name['ip']
-        return device_id
+            pass
+
+        cached = _DISCOVERED_IPS.get(device_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # id is a common name, try discovery
+        device_name = get_name(device_id)
+        if device_name is None:
+            # try DNS
+            try:
+                device_ip = socket.gethostbyname(device_id)
+            except socket.gaierror as exc:
+                raise ValueError(f"no device found for {device_id}") from exc
+        else:
+            device_ip = device_name['ip']
+
+        _DISCOVERED_IPS[device_id] = (time.monotonic() + DISCOVER_IP_TTL, device_ip)
+        return device_ip
 
     def __init__(self, device_id, session: Optional[ClientSession] = None):
         """Init the pydaikin appliance, representing one Daikin device."""
         self.values = ApplianceValues()
         self.session = session
-        self._energy_consumption_history = defaultdict(list)
+        self._energy_consumption_history = defaultdict(deque)
+        self._parsed_cache = {}
+        self._last_energy_raw = None
         if session:
             self.device_ip = device_id
         else:
@@ -120,14 +198,12 @@ class Appliance(DaikinPowerMixin):  # pylint: disable=too-many-public-methods
             params = {}
 
         if self.session is None:
-            session = ClientSession()
+            session = await _get_shared_session()
         else:
             session = self.session
 
-        async with session as client_session, self.request_semaphore:
-            async with client_session.get(
-                f'{self.base_url}/{path}', params=params
-            ) as resp:
+        async with self.request_semaphore:
+            async with session.get(f'{self.base_url}/{path}', params=params) as resp:
                 if resp.status == 403:
                     raise HTTPForbidden
                 assert resp.status == 200, f"Response code is {resp.status}"
@@ -143,22 +219,31 @@ class Appliance(DaikinPowerMixin):  # pylint: disable=too-many-public-methods
             if self.values.should_resource_be_updated(resource)
         ]
         _LOGGER.debug("Updating %s", resources)
-        async with asyncio.TaskGroup() as tg:
-            tasks = [
-                tg.create_task(self._get_resource(resource)) for resource in resources
-            ]
+        results = await asyncio.gather(
+            *(self._get_resource(resource) for resource in resources),
+            return_exceptions=True,
+        )
 
-        for resource, task in zip(resources, tasks):
-            self.values.update_by_resource(resource, task.result())
+        # Keep whatever was fetched even if some resources failed
+        errors = []
+        for resource, result in zip(resources, results):
+            if isinstance(result, BaseException):
+                _LOGGER.debug("Failed to update %s: %r", resource, result)
+                errors.append(result)
+            else:
+                self.values.update_by_resource(resource, result)
 
         self._register_energy_consumption_history()
 
+        if errors:
+            raise errors[0]
+
     def show_values(self, only_summary=False):
         """Print values."""
         if only_summary:
             keys = self.VALUES_SUMMARY
         else:
-            keys = sorted(self.values.keys())
+            keys = self.values.sorted_keys()
 
         for key in keys:
             if key in self.values:
@@ -226,7 +311,6 @@ class Appliance(DaikinPowerMixin):  # pylint: disable=too-many-public-methods
         if key == 'mode' and self.values['pow'] == '0':
             val = 'off'
         elif key == 'mac':
-            val = self.translate_mac(val)
             val = unquote(self.values[key]).split(';')
         else:
             val = self.daikin_to_human(key, val)
@@ -236,8 +320,12 @@ class Appliance(DaikinPowerMixin):  # pylint: disable=too-many-public-methods
 
     def _parse_number(self, dimension) -> Optional[float]:
         """Parse float number."""
+        value = self.values.get(dimension)
+        # Missing values and placeholders (see DaikinAirBase.DEFAULTS)
+        if value in (None, '-', '--'):
+            return None
         try:
-            return float(self.values.get(dimension))
+            return float(value)
         except (TypeError, ValueError):
             return None
 
@@ -91,7 +91,7 @@ class DaikinSkyFi(Appliance):
     def parse_response(response_body):
         """Parse response from Daikin and map it to general Daikin format."""
         _LOGGER.debug("Parsing %s", response_body)
-        response = dict([e.split('=') for e in response_body.split('&')])
+        response = dict(e.split('=', 1) for e in response_body.split('&') if e)
         if response.get('fanflags') == '3':
             response['fanspeed'] = str(int(response['fanspeed']) + 4)
         response.update(
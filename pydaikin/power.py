@@ -2,6 +2,7 @@
 
 from collections import namedtuple
 from datetime import datetime, timedelta
+from itertools import pairwise
 import logging
 
 ENERGY_CONSUMPTION_MAX_HISTORY = timedelta(hours=6)
@@ -30,6 +31,8 @@ _LOGGER = logging.getLogger(__name__)
 class DaikinPowerMixin:
     """Mixin to provide power monitoring capability"""
 
+    __slots__ = ('_parsed_cache', '_last_energy_raw')
+
     _energy_consumption_history = None
     values = None
 
@@ -72,34 +75,40 @@ class DaikinPowerMixin:
         the energy consumption can be reported as non-supported during the first month if there
         is no consumption in the last 7 days.
         (see https://github.com/home-assistant/core/issues/77877)"""
-        return (
-            (
-                self.energy_consumption(
-                    mode=ATTR_TOTAL, time=TIME_THIS_YEAR, invalidate=False
-                )
-                or 0
-            )
-            + (
-                self.energy_consumption(
-                    mode=ATTR_TOTAL, time=TIME_LAST_YEAR, invalidate=False
-                )
-                or 0
-            )
-            + (
-                self.energy_consumption(
-                    mode=ATTR_TOTAL, time=TIME_LAST_7_DAYS, invalidate=False
-                )
-                or 0
-            )
-        ) > 0
+        # All three periods are sums of non-negative counters, so any non-zero
+        # digit in their raw values means a consumption > 0 without parsing them
+        for time in (TIME_THIS_YEAR, TIME_LAST_YEAR, TIME_LAST_7_DAYS):
+            dimension = self.ENERGY_CONSUMPTION_PARSERS[
+                f'{ATTR_TOTAL}_{time}'
+            ].dimension
+            raw = self.values.get(dimension, invalidate=False) or ''
+            if any(char in '123456789' for char in raw):
+                return True
+        return False
 
     def _register_energy_consumption_history(self):
         if not self.support_energy_consumption:
             return
 
+        # Unchanged raw values would only produce already registered states
+        raw = tuple(
+            self.values.get(
+                self.ENERGY_CONSUMPTION_PARSERS[f'{mode}_{time}'].dimension,
+                invalidate=False,
+            )
+            for mode in (ATTR_TOTAL, ATTR_COOL, ATTR_HEAT)
+            for time in (TIME_TODAY, TIME_YESTERDAY)
+        )
+        if raw == self._last_energy_raw:
+            return
+        self._last_energy_raw = raw
+
+        now = datetime.utcnow()
+        cutoff = now - ENERGY_CONSUMPTION_MAX_HISTORY
+
         for mode in (ATTR_TOTAL, ATTR_COOL, ATTR_HEAT):
             new_state = EnergyConsumptionState(
-                datetime=datetime.utcnow(),
+                datetime=now,
                 first_state=not (self._energy_consumption_history[mode]),
                 today=self.energy_consumption(
                     mode=mode, time=TIME_TODAY, invalidate=False
@@ -112,7 +121,7 @@ class DaikinPowerMixin:
                 continue
 
             if not new_state.first_state:
-                old_state = self._energy_consumption_history[mode][0]
+                old_state = self._energy_consumption_history[mode][-1]
 
                 if new_state.today == old_state.today:
                     if new_state.yesterday == old_state.yesterday:
@@ -120,27 +129,12 @@ class DaikinPowerMixin:
                         # we just update the cmp_freq average
                         continue
 
-            self._energy_consumption_history[mode].insert(0, new_state)
-
-            # We can remove very old states (except the latest one)
-            idx = (
-                min(
-                    (
-                        i
-                        for i, state in enumerate(
-                            self._energy_consumption_history[mode]
-                        )
-                        if state.datetime
-                        < datetime.utcnow() - ENERGY_CONSUMPTION_MAX_HISTORY
-                    ),
-                    default=len(self._energy_consumption_history[mode]),
-                )
-                + 1
-            )
+            history = self._energy_consumption_history[mode]
+            history.append(new_state)
 
-            self._energy_consumption_history[mode] = self._energy_consumption_history[
-                mode
-            ][:idx]
+            # We can remove very old states (except the most recent of them)
+            while len(history) > 1 and history[1].datetime < cutoff:
+                history.popleft()
 
     def energy_consumption(
         self, mode=ATTR_TOTAL, time=TIME_TODAY, invalidate: bool = True
@@ -151,18 +145,23 @@ class DaikinPowerMixin:
             raise ValueError(f'Unsupported mode {mode} on {time}.')
 
         try:
-            values = [
-                int(x)
-                for x in self.values.get(parser.dimension, invalidate=invalidate).split(
-                    '/'
-                )
-            ]
+            values = self._energy_consumption(parser.dimension, invalidate=invalidate)
             value = parser.reducer(values)
             value /= parser.divider
             return value
         except (TypeError, IndexError, AttributeError, ValueError):
             return None
 
+    def _energy_consumption(self, dimension, invalidate: bool = True):
+        """Return the integers of a '/' separated dimension, parsed once per value."""
+        raw = self.values.get(dimension, invalidate=invalidate)
+        cached = self._parsed_cache.get(dimension)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        parsed = list(map(int, raw.split('/')))
+        self._parsed_cache[dimension] = (raw, parsed)
+        return parsed
+
     @staticmethod
     def _compute_diff_energy(mode: str, curr, prev):
         """Return the energy consumption delta between two states"""
@@ -216,13 +215,13 @@ class DaikinPowerMixin:
             # The sensor has not been properly initialized
             return 0
 
-        history = list(reversed(self._energy_consumption_history[mode]))
+        history = self._energy_consumption_history[mode]
 
         energy_to_log = 0
         exp_diff_time = None
         est_power = 0
 
-        for prev, curr in zip(history, history[1:]):
+        for prev, curr in pairwise(history):
             diff_time = curr.datetime - prev.datetime
             diff_energy = self._compute_diff_energy(mode, curr, prev)
 
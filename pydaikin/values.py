@@ -14,6 +14,9 @@ class ApplianceValues(MutableMapping):
         self._data = {}
         self._last_update_by_resource = {}
         self._resource_by_key = {}
+        # Bumped whenever a key is added or removed
+        self._keys_version = 0
+        self._sorted_keys = (-1, ())
 
     # --- Implementation of abstract methods ---
 
@@ -25,10 +28,13 @@ class ApplianceValues(MutableMapping):
         return self._data[key]
 
     def __setitem__(self, key, value):
+        if key not in self._data:
+            self._keys_version += 1
         self._data[key] = value
 
     def __delitem__(self, key):
         del self._data[key]
+        self._keys_version += 1
         del self._resource_by_key[key]
 
     def __iter__(self):
@@ -52,19 +58,30 @@ class ApplianceValues(MutableMapping):
         """Return values' keys"""
         return self._data.keys()
 
+    def sorted_keys(self) -> tuple:
+        """Return values' keys sorted, cached until a key is added or removed."""
+        version, keys = self._sorted_keys
+        if version != self._keys_version:
+            keys = tuple(sorted(self._data))
+            self._sorted_keys = (self._keys_version, keys)
+        return keys
+
     def should_resource_be_updated(self, resource: str) -> bool:
         """Returns whether a resource should be updated, considering recent use of values
         it returns."""
         # Keep only resources which have been updated recently
+        cutoff = datetime.utcnow() - self.TTL
         self._last_update_by_resource = {
             resource: last_update
             for resource, last_update in self._last_update_by_resource.items()
-            if datetime.utcnow() - last_update < self.TTL
+            if last_update > cutoff
         }
         return resource not in self._last_update_by_resource
 
     def update_by_resource(self, resource: str, data: dict):
         """Update the values and keep track of which resource provided them."""
+        if not data.keys() <= self._data.keys():
+            self._keys_version += 1
         self._data.update(data)
         self._last_update_by_resource[resource] = datetime.utcnow()
         for k in data.keys():
@@ -1,5 +1,12 @@
+import asyncio
+from unittest.mock import patch
+
+from aiohttp import ClientSession
 import pytest
 
+from pydaikin import daikin_base
+from pydaikin.daikin_base import Appliance, _get_shared_session, close_shared_session
+from pydaikin.daikin_brp069 import DaikinBRP069
 from pydaikin.response import parse_response
 
 
@@ -45,3 +52,85 @@ from pydaikin.response import parse_response
 )
 def test_parse_response(body: str, values: dict):
     assert parse_response(body) == values
+
+
+@pytest.mark.asyncio
+async def test_shared_session_lifecycle():
+    session = await _get_shared_session()
+    assert await _get_shared_session() is session
+    await close_shared_session()
+    assert session.closed
+    assert await _get_shared_session() is not session
+    await close_shared_session()
+
+
+@pytest.mark.asyncio
+async def test_injected_session_is_not_shared():
+    def get(url, params):
+        raise ValueError(url)
+
+    async with ClientSession() as session:
+        device = DaikinBRP069('127.0.0.1', session)
+        with patch.object(session, 'get', side_effect=get) as session_get:
+            with pytest.raises(ValueError):
+                await device._get_resource('common/basic_info')
+        session_get.assert_called_once()
+        assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_update_status_keeps_partial_results():
+    async def get_resource(resource, params=None):
+        if resource == 'aircon/get_control_info':
+            raise ValueError(resource)
+        return dict(htemp='21.0')
+
+    with patch.object(DaikinBRP069, 'discover_ip', return_value='127.0.0.1'):
+        device = DaikinBRP069('ip')
+    with patch.object(device, '_get_resource', side_effect=get_resource):
+        with pytest.raises(ValueError):
+            await device.update_status()
+    assert device.values['htemp'] == '21.0'
+
+
+@pytest.fixture
+def resolver():
+    """Mock discovery and DNS with an empty discover_ip cache."""
+    with patch.dict(daikin_base._DISCOVERED_IPS, clear=True), patch(
+        'pydaikin.daikin_base.get_name', return_value=None
+    ), patch('socket.gethostbyname', return_value='192.168.1.20') as gethostbyname:
+        yield gethostbyname
+
+
+def test_discover_ip_returns_resolved_address(resolver):
+    assert Appliance.discover_ip('daikin.local') == '192.168.1.20'
+    assert Appliance.discover_ip('daikin.local') == '192.168.1.20'
+    resolver.assert_called_once_with('daikin.local')
+
+
+def test_discover_ip_cache_expires(resolver):
+    with patch('time.monotonic', return_value=1000):
+        assert Appliance.discover_ip('daikin.local') == '192.168.1.20'
+    resolver.return_value = '192.168.1.21'
+    with patch('time.monotonic', return_value=1000 + daikin_base.DISCOVER_IP_TTL):
+        assert Appliance.discover_ip('daikin.local') == '192.168.1.21'
+    assert resolver.call_count == 2
+
+
+def test_shared_session_per_event_loop():
+    loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        session_a = loop_a.run_until_complete(_get_shared_session())
+        session_b = loop_b.run_until_complete(_get_shared_session())
+        assert session_a is not session_b
+        assert loop_a.run_until_complete(_get_shared_session()) is session_a
+
+        loop_b.run_until_complete(close_shared_session())
+        assert session_b.closed
+        assert not session_a.closed
+
+        loop_a.run_until_complete(close_shared_session())
+        assert session_a.closed
+    finally:
+        loop_a.close()
+        loop_b.close()
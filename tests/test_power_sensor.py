@@ -46,7 +46,7 @@ def device():
             0.1 for dt in heat_energy_100w_ticks if dt0 - timedelta(hours=1) < dt <= dt0
         )
 
-    def values_get(key, default=None):
+    def values_get(key, default=None, invalidate=True):
         try:
             return values_getitem(key)
         except KeyError:
@@ -261,3 +261,88 @@ async def test_power_sensors(initial_date, duration, tick_step, device: DaikinBR
         relative_error(heat_energy, len(device._heat_energy_100w_ticks) / 10)
         < max_relative_error
     )
+
+
+@pytest.fixture
+def brp069():
+    """Device with real values and no network access."""
+    with patch.object(DaikinBRP069, 'discover_ip', return_value='127.0.0.1'):
+        yield DaikinBRP069('ip')
+
+
+def _set_energy(device, total_today, cool_today=0):
+    device.values.update_by_resource(
+        'aircon/get_day_power_ex',
+        dict(
+            datas=f'0/1000/{total_today}',
+            curr_day_cool=str(cool_today),
+            prev_1day_cool='0',
+            curr_day_heat='0',
+            prev_1day_heat='0',
+        ),
+    )
+
+
+def test_energy_history_is_chronological_and_trimmed(brp069):
+    """History is oldest first and keeps one state older than the cutoff."""
+    with freeze_time(datetime(2024, 1, 1, 8, 0)) as ft:
+        for i in range(10):
+            _set_energy(brp069, 1000 + 100 * i)
+            brp069._register_energy_consumption_history()
+            ft.tick(timedelta(hours=1))
+
+        history = brp069._energy_consumption_history['total']
+        dates = [state.datetime for state in history]
+        assert dates == sorted(dates)
+        assert history[-1].today == 1.9
+
+        cutoff = dates[-1] - timedelta(hours=6)
+        assert dates[0] < cutoff <= dates[1]
+        assert dates[0] == datetime(2024, 1, 1, 10, 0)
+        assert brp069.current_total_power_consumption == pytest.approx(0.1)
+
+
+def test_energy_history_skips_unchanged_values(brp069):
+    """Identical raw values do not register a new state."""
+    with freeze_time(datetime(2024, 1, 1, 8, 0)) as ft:
+        _set_energy(brp069, 1000, cool_today=3)
+        brp069._register_energy_consumption_history()
+        ft.tick(timedelta(minutes=10))
+
+        with patch.object(
+            brp069, 'energy_consumption', wraps=brp069.energy_consumption
+        ) as energy_consumption:
+            _set_energy(brp069, 1000, cool_today=3)
+            brp069._register_energy_consumption_history()
+        energy_consumption.assert_not_called()
+
+        for mode in ('total', 'cool', 'heat'):
+            history = brp069._energy_consumption_history[mode]
+            assert len(history) == 1
+            assert history[0].datetime == datetime(2024, 1, 1, 8, 0)
+
+        ft.tick(timedelta(minutes=10))
+        _set_energy(brp069, 1100, cool_today=3)
+        brp069._register_energy_consumption_history()
+        assert len(brp069._energy_consumption_history['total']) == 2
+        assert len(brp069._energy_consumption_history['cool']) == 1
+
+
+@pytest.mark.parametrize(
+    'this_year,previous_year,datas,supported',
+    [
+        (None, None, None, False),
+        ('0/0/0', '0/0/0', '0/0/0', False),
+        ('-', '-', '-', False),
+        ('0/0/10', '0/0/0', '0/0/0', True),
+        ('-', '0/3/0', '-', True),
+        ('0/0/0', '0/0/0', '0/0/100', True),
+    ],
+)
+def test_support_energy_consumption(brp069, this_year, previous_year, datas, supported):
+    values = dict(this_year=this_year, previous_year=previous_year, datas=datas)
+    brp069.values.update_by_resource(
+        'aircon/get_year_power',
+        {key: value for key, value in values.items() if value is not None},
+    )
+    assert brp069.support_energy_consumption is supported
@@ -0,0 +1,30 @@
+import pytest
+
+from pydaikin.values import ApplianceValues
+
+
+def test_sorted_keys_follow_key_changes():
+    values = ApplianceValues()
+    values.update_by_resource('aircon/get_sensor_info', dict(otemp='9', htemp='21'))
+    assert values.sorted_keys() == ('htemp', 'otemp')
+
+    values.update_by_resource('aircon/get_sensor_info', dict(htemp='22'))
+    assert values.sorted_keys() == ('htemp', 'otemp')
+
+    values['adv'] = ''
+    assert values.sorted_keys() == ('adv', 'htemp', 'otemp')
+
+    values.update_by_resource('aircon/get_control_info', dict(pow='1'))
+    assert values.sorted_keys() == ('adv', 'htemp', 'otemp', 'pow')
+
+
+def test_sorted_keys_after_deleting_key_without_resource():
+    values = ApplianceValues()
+    values['a'] = 1
+    values['b'] = 2
+    assert values.sorted_keys() == ('a', 'b')
+
+    # Keys set directly have no resource, so __delitem__ raises after removal
+    with pytest.raises(KeyError):
+        del values['a']
+    assert values.sorted_keys() == ('b',)